@@ -19,6 +19,9 @@ def _read_prompt_file(filename):
 
 DEFAULT_EXPERT_PROMPT = _read_prompt_file("expert_prompt.txt")
 DEFAULT_MARKET_PROMPT = _read_prompt_file("market_prompt.txt")
+DEFAULT_DIGEST_PROMPT = _read_prompt_file("digest_prompt.txt")
 
 DEFAULT_CATEGORIES = ["Finance", "Technology", "Education", "Entertainment", "News", "Sports", "Other"]
 DEFAULT_TRANSCRIPT_LANGUAGE = os.getenv("DEFAULT_TRANSCRIPT_LANGUAGE", "en")
+TRANSCRIPT_POOL_SIZE = int(os.getenv("TRANSCRIPT_POOL_SIZE", "10"))
+DIGEST_CACHE_DIR = os.getenv("DIGEST_CACHE_DIR", os.path.join("outputs", "digest_cache"))
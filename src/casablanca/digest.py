@@ -0,0 +1,216 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timedelta
+import click
+
+from .config import OBSIDIAN_VAULT_PATH, GEMINI_API_KEY, DEFAULT_DIGEST_PROMPT, DIGEST_CACHE_DIR
+from .services import GeminiService
+from .exceptions import GeminiServiceError
+from .file_utils import atomic_write, EXPERT_SUMMARY_FILENAME, MARKET_SUMMARY_FILENAME
+from .logging_utils import configure_logging
+
+DAILY_DIGEST_FILENAME = "Market View.md"
+WEEKLY_DIGEST_FOLDER = "Digests"
+DEFAULT_FAN_IN = 8
+
+
+class DigestBuilder:
+    """Builds daily and weekly market view notes from the per-video summaries in the vault.
+
+    Each day is rolled up as a tree: video summaries are grouped ``fan_in`` at a
+    time, each group is summarized, and the group summaries are summarized again
+    until a single day digest remains. Week digests are built from day digests the
+    same way, and a group with a single entry is passed up unchanged. Every rollup
+    is cached under a hash of its prompt and inputs, and videos keep the order in
+    which they were first seen, so when a video is added or re-processed only its
+    group, the levels above it and its week are sent to Gemini again; everything
+    else comes from the cache.
+    """
+
+    def __init__(self, gemini_service, vault_path, cache_dir=DIGEST_CACHE_DIR, prompt=DEFAULT_DIGEST_PROMPT, fan_in=DEFAULT_FAN_IN):
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2.")
+        self.gemini_service = gemini_service
+        self.vault_path = os.path.expanduser(vault_path)
+        self.cache_dir = cache_dir
+        self.prompt = prompt
+        self.fan_in = fan_in
+
+    def _video_summaries(self, date):
+        date_folder = os.path.join(self.vault_path, date)
+        if not os.path.isdir(date_folder):
+            return []
+
+        videos = {}
+        for title in os.listdir(date_folder):
+            video_folder = os.path.join(date_folder, title)
+            market_path = os.path.join(video_folder, MARKET_SUMMARY_FILENAME)
+            expert_path = os.path.join(video_folder, EXPERT_SUMMARY_FILENAME)
+            if title.startswith(".") or not os.path.isfile(market_path):
+                continue
+            sections = [f"## {title}"]
+            with open(market_path, "r") as f:
+                sections.append(f"### Market direction\n{f.read().strip()}")
+            if os.path.isfile(expert_path):
+                with open(expert_path, "r") as f:
+                    sections.append(f"### Expert opinions\n{f.read().strip()}")
+            videos[title] = (os.path.getmtime(market_path), "\n\n".join(sections))
+
+        order = self._video_order(date, videos)
+        return [videos[title][1] for title in order if title in videos]
+
+    def _video_order(self, date, videos):
+        # Videos keep the position they were first seen in, so a new video joins the
+        # last group and a re-processed one stays in its own group, instead of
+        # shifting every group boundary and invalidating the whole day.
+        index_path = os.path.join(self.cache_dir, "order", f"{date}.json")
+        order = []
+        if os.path.exists(index_path):
+            with open(index_path, "r") as f:
+                order = json.load(f)
+        new_titles = sorted((title for title in videos if title not in order), key=lambda title: (videos[title][0], title))
+        if new_titles:
+            order.extend(new_titles)
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            atomic_write(index_path, json.dumps(order, ensure_ascii=False, indent=2))
+        return order
+
+    def _cache_path(self, texts):
+        digest = hashlib.sha256()
+        for part in [self.prompt, *texts]:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return os.path.join(self.cache_dir, f"{digest.hexdigest()}.md")
+
+    def _summarize(self, texts, label):
+        if len(texts) == 1:
+            # Nothing to combine, so a lone entry is passed up the tree unchanged
+            return texts[0]
+        cache_path = self._cache_path(texts)
+        if os.path.exists(cache_path):
+            logging.debug("Using cached rollup for %s: %s", label, cache_path)
+            with open(cache_path, "r") as f:
+                return f.read()
+
+        logging.info("Summarizing %d entries for %s...", len(texts), label)
+        summary = self.gemini_service.summarize_content("\n\n---\n\n".join(texts), self.prompt, source_label="Summaries")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        atomic_write(cache_path, summary)
+        return summary
+
+    def _rollup(self, texts, label):
+        while len(texts) > self.fan_in:
+            texts = [
+                self._summarize(texts[i:i + self.fan_in], label)
+                for i in range(0, len(texts), self.fan_in)
+            ]
+        return self._summarize(texts, label)
+
+    def build_day(self, date):
+        """Return the digest for a ``YYYY-MM-DD`` date folder, or None if it has no summaries."""
+        summaries = self._video_summaries(date)
+        if not summaries:
+            return None
+        return self._rollup(summaries, date)
+
+    def build_week(self, day):
+        """Return the digest for the ISO week containing ``day``, or None if the week has no summaries."""
+        monday = day - timedelta(days=day.weekday())
+        day_digests = []
+        for offset in range(7):
+            date = (monday + timedelta(days=offset)).strftime("%Y-%m-%d")
+            day_digest = self.build_day(date)
+            if day_digest:
+                day_digests.append(f"## {date}\n\n{day_digest}")
+        if not day_digests:
+            return None
+        return self._rollup(day_digests, self.week_label(day))
+
+    @staticmethod
+    def week_label(day):
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02d}"
+
+    def write_day(self, date):
+        day_digest = self.build_day(date)
+        if day_digest is None:
+            logging.info("No video summaries found for %s. Skipping.", date)
+            return None
+        path = os.path.join(self.vault_path, date, DAILY_DIGEST_FILENAME)
+        atomic_write(path, f"# Market View {date}\n\n{day_digest}\n")
+        logging.info("Daily digest saved to %s", path)
+        return path
+
+    def write_week(self, day):
+        week_digest = self.build_week(day)
+        label = self.week_label(day)
+        if week_digest is None:
+            logging.info("No video summaries found for %s. Skipping.", label)
+            return None
+        folder = os.path.join(self.vault_path, WEEKLY_DIGEST_FOLDER)
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"{label}.md")
+        atomic_write(path, f"# Market View {label}\n\n{week_digest}\n")
+        logging.info("Weekly digest saved to %s", path)
+        return path
+
+    def write_range(self, start, end, weekly=False):
+        """Write daily digests for every date from ``start`` to ``end`` inclusive.
+
+        With ``weekly`` set, also write a digest for each ISO week the range touches.
+        Returns the paths of the notes that were written.
+        """
+        paths = []
+        weeks = {}
+        day = start
+        while day <= end:
+            path = self.write_day(day.strftime("%Y-%m-%d"))
+            if path:
+                paths.append(path)
+            weeks.setdefault(self.week_label(day), day)
+            day += timedelta(days=1)
+        if weekly:
+            for week_day in weeks.values():
+                path = self.write_week(week_day)
+                if path:
+                    paths.append(path)
+        return paths
+
+
+def _parse_date(_ctx, _param, value):
+    if value is None:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise click.BadParameter("Dates must be in YYYY-MM-DD format.")
+
+@click.command()
+@click.argument('start_date', callback=_parse_date)
+@click.argument('end_date', required=False, callback=_parse_date)
+@click.option('--weekly', is_flag=True, help='Also build a digest for each ISO week the date range touches.')
+@click.option('--fan-in', default=DEFAULT_FAN_IN, type=click.IntRange(min=2), help='Maximum number of summaries combined in a single rollup.')
+@click.option('--log-level', default='INFO', type=click.Choice(['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'], case_sensitive=False), help='Set the logging level.')
+def cli(start_date, end_date, weekly, fan_in, log_level):
+    configure_logging(log_level)
+    if not OBSIDIAN_VAULT_PATH:
+        logging.error("OBSIDIAN_VAULT_PATH not set. Cannot build digests.")
+        sys.exit(1)
+    end_date = end_date or start_date
+    if end_date < start_date:
+        raise click.BadParameter("END_DATE must not be before START_DATE.", param_hint="end_date")
+
+    builder = DigestBuilder(GeminiService(GEMINI_API_KEY), OBSIDIAN_VAULT_PATH, fan_in=fan_in)
+    try:
+        paths = builder.write_range(start_date, end_date, weekly=weekly)
+    except (GeminiServiceError, OSError) as e:
+        logging.error("Digest error: %s", e)
+        sys.exit(1)
+    logging.info("Wrote %d digest note(s).", len(paths))
+    sys.exit(0)
+
+if __name__ == "__main__":
+    cli()
@@ -8,4 +8,8 @@ class TranscriptError(Exception):
 
 class GeminiServiceError(Exception):
     """Custom exception for errors related to Gemini API service."""
-    pass
\ No newline at end of file
+    pass
+
+class OutputSinkError(Exception):
+    """Custom exception for errors related to writing output files."""
+    pass
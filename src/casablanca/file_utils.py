@@ -1,10 +1,11 @@
 import os
-import shutil
-import logging
+import uuid
 
 import re
 
-from .models import Video
+EXPERT_SUMMARY_FILENAME = "expert_summary.md"
+MARKET_SUMMARY_FILENAME = "market_summary.md"
+TRANSCRIPT_FILENAME = "transcript.txt"
 
 def sanitize_title(title):
     # Remove characters that are not alphanumeric, spaces, hyphens, or underscores
@@ -13,27 +14,35 @@ def sanitize_title(title):
     sanitized = re.sub(r'\s+', ' ', sanitized).strip()
     return sanitized
 
-def generate_output_paths(video_id):
+def generate_transcript_path(video_id):
     output_dir = os.path.join("outputs", video_id)
     os.makedirs(output_dir, exist_ok=True)
-    expert_summary_path = os.path.join(output_dir, "expert_summary.md")
-    market_summary_path = os.path.join(output_dir, "market_summary.md")
-    return output_dir, expert_summary_path, market_summary_path
+    return os.path.join(output_dir, TRANSCRIPT_FILENAME)
 
-def move_to_obsidian(video: Video, expert_summary_path, market_summary_path, obsidian_path):
-    if not obsidian_path:
-        logging.warning("OBSIDIAN_VAULT_PATH not set. Skipping move to Obsidian.")
-        return
+def temp_path_for(path):
+    # Hidden sibling in the same directory, so renaming it over `path` stays on one filesystem
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
 
-    sanitized_title = sanitize_title(video.title)
-    date_folder = video.date
-    obsidian_dest_folder = os.path.expanduser(os.path.join(obsidian_path, date_folder, sanitized_title))
-    
+def fsync_path(path):
+    fd = os.open(path, os.O_RDONLY)
     try:
-        os.makedirs(obsidian_dest_folder, exist_ok=True)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
-        shutil.move(expert_summary_path, os.path.join(obsidian_dest_folder, "expert_summary.md"))
-        shutil.move(market_summary_path, os.path.join(obsidian_dest_folder, "market_summary.md"))
-        logging.info(f"Moved summary files to Obsidian vault: {obsidian_dest_folder}")
-    except Exception as e:
-        logging.error(f"Error moving summary files: {e}")
\ No newline at end of file
+def atomic_write(path, content, fsync=False):
+    temp_path = temp_path_for(path)
+    try:
+        with open(temp_path, "x") as f:
+            f.write(content)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if fsync:
+        fsync_path(os.path.dirname(path) or ".")
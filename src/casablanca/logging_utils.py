@@ -0,0 +1,99 @@
+import contextvars
+import copy
+import json
+import logging
+import queue
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_current_video_id = contextvars.ContextVar("casablanca_video_id", default=None)
+
+
+@contextmanager
+def video_context(video_id):
+    """Tag every log record emitted inside the block with the given video ID."""
+    token = _current_video_id.set(video_id)
+    try:
+        yield
+    finally:
+        _current_video_id.reset(token)
+
+
+class VideoContextFilter(logging.Filter):
+    def filter(self, record):
+        if not hasattr(record, "video_id"):
+            record.video_id = _current_video_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "video_id": getattr(record, "video_id", None),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """QueueHandler that leaves all formatting to the listener's handlers.
+
+    The stdlib ``prepare`` formats the record in the calling thread and folds the
+    traceback into ``msg``, which both keeps that cost on the caller and hides
+    ``exc_info`` from formatters such as JsonFormatter. The queue never leaves this
+    process, so the record can be passed through as-is.
+    """
+
+    def prepare(self, record):
+        return copy.copy(record)
+
+
+def start_queue_listener(handlers):
+    """Route records through a queue so callers never block on handler I/O.
+
+    Returns the QueueHandler to attach in place of ``handlers`` and the running
+    listener, which writes to ``handlers`` from a background thread. Stop the
+    listener before exiting to flush any queued records.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return DeferredFormatQueueHandler(log_queue), listener
+
+
+def configure_logging(log_level, queue_logging=False, json_format=False):
+    formatter = JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT)
+
+    # Set up console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+
+    # Set up file handler with rotation
+    file_handler = RotatingFileHandler('casablanca.log', maxBytes=1024*1024*5, backupCount=5) # 5 MB per file, 5 backup files
+    file_handler.setFormatter(formatter)
+
+    handlers = [console_handler, file_handler]
+    listener = None
+    if queue_logging:
+        # Hand records off to a background writer thread instead of doing I/O inline
+        queue_handler, listener = start_queue_listener(handlers)
+        handlers = [queue_handler]
+
+    video_filter = VideoContextFilter()
+    for handler in handlers:
+        handler.addFilter(video_filter)
+        logging.root.addHandler(handler)
+
+    # Set the logging level
+    logging.root.setLevel(getattr(logging, log_level.upper()))
+    return listener
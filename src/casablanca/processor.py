@@ -1,92 +1,90 @@
 import logging
-import os
-from .file_utils import move_to_obsidian, sanitize_title, generate_output_paths
-from .exceptions import VideoMetadataError, TranscriptError
+from .file_utils import generate_transcript_path, atomic_write, EXPERT_SUMMARY_FILENAME, MARKET_SUMMARY_FILENAME, TRANSCRIPT_FILENAME
+from .exceptions import VideoMetadataError, TranscriptError, GeminiServiceError
+from .sinks import create_output_sink
 from .models import Video
+from .logging_utils import video_context
 
 
 class VideoProcessor:
-    def __init__(self, youtube_service, gemini_service, obsidian_vault_path, default_categories):
+    def __init__(self, youtube_service, gemini_service, obsidian_vault_path, default_categories, sink=None):
         self.youtube_service = youtube_service
         self.gemini_service = gemini_service
         self.obsidian_vault_path = obsidian_vault_path
         self.default_categories = default_categories
+        self.sink = sink or create_output_sink(obsidian_vault_path)
 
     def _get_video_info(self, video_url) -> Video:
         video = self.youtube_service.get_video_metadata(video_url)
         if not video:
             raise VideoMetadataError("Failed to get video metadata.")
 
-        logging.debug(f"Video metadata: {video}")
+        logging.debug("Video metadata: %s", video)
         return video
 
     def _check_existing_output(self, video_id, video: Video, force):
-        if not force and self.obsidian_vault_path:
-            sanitized_title = sanitize_title(video.title)
-            date_folder = video.date
-            obsidian_dest_folder = os.path.expanduser(os.path.join(self.obsidian_vault_path, date_folder, sanitized_title))
-            if os.path.exists(obsidian_dest_folder):
-                logging.info(f"Obsidian folder for {video_id} already exists. Skipping.")
-                return True
+        if not force and self.sink.exists(video_id, video):
+            logging.info("Output folder for %s already exists. Skipping.", video_id)
+            return True
         return False
 
     def _classify_video(self, video_title, video_description, categories):
         try:
             categories_list = [c.strip() for c in categories.split(',')]
-            logging.debug(f"Using categories: {categories_list}")
+            logging.debug("Using categories: %s", categories_list)
             video_category = self.gemini_service.get_video_category(video_title, video_description, categories_list)
-            logging.info(f"Video Category: {video_category}")
+            logging.info("Video Category: %s", video_category)
             return video_category
         except GeminiServiceError as e:
-            logging.error(f"Video classification failed: {e}")
+            logging.error("Video classification failed: %s", e)
             raise
 
-    def _process_finance_video(self, video_url, output_dir, expert_summary_path, market_summary_path, expert_prompt, market_prompt, video: Video):
+    def _process_finance_video(self, video_id, video_url, expert_prompt, market_prompt, video: Video):
         logging.info("Video is finance-related. Proceeding with transcript fetching and summarization.")
         transcript = self.youtube_service.get_transcript(video_url)
 
         if not transcript:
             raise TranscriptError("Failed to fetch transcript. Exiting summarization process.")
 
-        transcript_path = os.path.join(output_dir, "transcript.txt")
-        with open(transcript_path, "w") as f:
-            f.write(transcript)
-        logging.info(f"Transcript saved to {transcript_path}")
-        logging.debug(f"Transcript content (first 100 chars): {transcript[:100]}...")
+        if not self.sink.keeps_transcript:
+            transcript_path = generate_transcript_path(video_id)
+            atomic_write(transcript_path, transcript)
+            logging.info("Transcript saved to %s", transcript_path)
+        logging.debug("Transcript content (first 100 chars): %s...", transcript[:100])
 
         logging.info("Summarizing expert opinions...")
         expert_summary = self.gemini_service.summarize_content(transcript, expert_prompt)
-        with open(expert_summary_path, "w") as f:
-            f.write(expert_summary)
-        logging.info(f"Expert summary saved to {expert_summary_path}")
-        logging.debug(f"Expert summary content (first 100 chars): {expert_summary[:100]}...")
+        logging.debug("Expert summary content (first 100 chars): %s...", expert_summary[:100])
 
         logging.info("Summarizing market direction and operation suggestions...")
         market_summary = self.gemini_service.summarize_content(transcript, market_prompt)
-        with open(market_summary_path, "w") as f:
-            f.write(market_summary)
-        logging.info(f"Market summary saved to {market_summary_path}")
-        logging.debug(f"Market summary content (first 100 chars): {market_summary[:100]}...")
+        logging.debug("Market summary content (first 100 chars): %s...", market_summary[:100])
 
-        move_to_obsidian(video, expert_summary_path, market_summary_path, self.obsidian_vault_path)
+        # The files are committed together so the destination never holds just some of them
+        files = {
+            EXPERT_SUMMARY_FILENAME: expert_summary,
+            MARKET_SUMMARY_FILENAME: market_summary,
+        }
+        if self.sink.keeps_transcript:
+            files[TRANSCRIPT_FILENAME] = transcript
+        self.sink.commit(video_id, video, files)
 
     def process(self, video_url, force, expert_prompt, market_prompt, categories):
         from .url_utils import extract_video_id
         video_id = extract_video_id(video_url)
-        output_dir, expert_summary_path, market_summary_path = generate_output_paths(video_id)
+        with video_context(video_id):
+            video = self._get_video_info(video_url)
 
-        video = self._get_video_info(video_url)
+            if self._check_existing_output(video_id, video, force):
+                return
 
-        if self._check_existing_output(video_id, video, force):
-            return
+            logging.info("Processing video URL: %s", video_url)
+            logging.info("Video Title: %s", video.title)
+            logging.info("Video Description: %s...", video.description[:100])
 
-        logging.info(f"Processing video URL: {video_url}")
-        logging.info(f"Video Title: {video.title}")
-        logging.info(f"Video Description: {video.description[:100]}...")
+            video_category = self._classify_video(video.title, video.description, categories)
 
-        video_category = self._classify_video(video.title, video.description, categories)
-
-        if video_category in ["Finance", "News"]:
-            self._process_finance_video(video_url, output_dir, expert_summary_path, market_summary_path, expert_prompt, market_prompt, video)
-        else:
-            logging.info(f"Video is not finance-related ({video_category}). Skipping transcript fetching and summarization.")
+            if video_category in ["Finance", "News"]:
+                self._process_finance_video(video_id, video_url, expert_prompt, market_prompt, video)
+            else:
+                logging.info("Video is not finance-related (%s). Skipping transcript fetching and summarization.", video_category)
@@ -1,24 +1,34 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import requests
+from requests.adapters import HTTPAdapter
 import google.generativeai as genai
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from youtube_transcript_api import YouTubeTranscriptApi, NoTranscriptFound, TranscriptsDisabled
 from datetime import datetime
 
-from .config import DEFAULT_TRANSCRIPT_LANGUAGE
+from .config import DEFAULT_TRANSCRIPT_LANGUAGE, TRANSCRIPT_POOL_SIZE
 from .url_utils import extract_video_id
 from .exceptions import VideoMetadataError, TranscriptError, GeminiServiceError
 from .models import Video
+from .logging_utils import video_context
 
 class YouTubeService:
-    def __init__(self, api_key):
+    def __init__(self, api_key, pool_size=TRANSCRIPT_POOL_SIZE):
         self.youtube = build("youtube", "v3", developerKey=api_key)
+        self.pool_size = pool_size
+        # urllib3's connection pool is thread-safe, so a single adapter is shared by
+        # every thread's session and connections are reused across all of them.
+        self._transcript_adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self._transcript_local = threading.local()
 
     def get_video_metadata(self, video_url):
         try:
             video_id = extract_video_id(video_url)
             if not video_id:
-                logging.error(f"Invalid video URL: {video_url}")
+                logging.error("Invalid video URL: %s", video_url)
                 raise VideoMetadataError(f"Invalid video URL: {video_url}")
             request = self.youtube.videos().list(part="snippet", id=video_id)
             response = request.execute()
@@ -30,30 +40,83 @@ class YouTubeService:
                     published_at=datetime.strptime(snippet["publishedAt"], "%Y-%m-%dT%H:%M:%SZ")
                 )
             else:
-                logging.error(f"No video found for ID: {video_id}")
+                logging.error("No video found for ID: %s", video_id)
                 raise VideoMetadataError(f"No video found for ID: {video_id}")
         except HttpError as e:
-            logging.error(f"HTTP error fetching video metadata for {video_url}: {e}")
+            logging.error("HTTP error fetching video metadata for %s: %s", video_url, e)
             raise VideoMetadataError(f"HTTP error fetching video metadata for {video_url}: {e}") from e
         except Exception as e:
-            logging.error(f"An unexpected error occurred while fetching video metadata for {video_url}: {e}")
+            logging.error("An unexpected error occurred while fetching video metadata for %s: %s", video_url, e)
             raise VideoMetadataError(f"An unexpected error occurred while fetching video metadata for {video_url}: {e}") from e
 
-    def get_transcript(self, video_url):
-        try:
-            video_id = extract_video_id(video_url)
-            logging.info(f"Attempting to fetch transcript for video ID: {video_id}")
-            transcript_list = YouTubeTranscriptApi().list(video_id)
-            transcript = transcript_list.find_transcript([DEFAULT_TRANSCRIPT_LANGUAGE])
-            transcript_data = transcript.fetch()
-            transcript_text = "\n".join([item.text for item in transcript_data.snippets])
-            return transcript_text
-        except (NoTranscriptFound, TranscriptsDisabled) as e:
-            logging.error(f"Transcript not available for {video_url}: {e}")
-            raise TranscriptError(f"Transcript not available for {video_url}: {e}") from e
-        except Exception as e:
-            logging.error(f"An unexpected error occurred while fetching transcript for {video_url}: {e}")
-            raise TranscriptError(f"An unexpected error occurred while fetching transcript for {video_url}: {e}") from e
+    @property
+    def transcript_api(self):
+        return self._get_transcript_api()
+
+    def _get_transcript_api(self):
+        # YouTubeTranscriptApi is not thread-safe, so each thread gets its own client
+        # and session, built lazily and kept for the service's lifetime.
+        transcript_api = getattr(self._transcript_local, "transcript_api", None)
+        if transcript_api is None:
+            session = requests.Session()
+            session.mount("https://", self._transcript_adapter)
+            session.mount("http://", self._transcript_adapter)
+            transcript_api = YouTubeTranscriptApi(http_client=session)
+            self._transcript_local.transcript_api = transcript_api
+        return transcript_api
+
+    def _transcript_languages(self, preferred_language=None):
+        if preferred_language and preferred_language != DEFAULT_TRANSCRIPT_LANGUAGE:
+            return [preferred_language, DEFAULT_TRANSCRIPT_LANGUAGE]
+        return [DEFAULT_TRANSCRIPT_LANGUAGE]
+
+    def _fetch_transcript(self, video_id, source, preferred_language=None):
+        with video_context(video_id):
+            try:
+                logging.info("Attempting to fetch transcript for video ID: %s", video_id)
+                transcript_list = self.transcript_api.list(video_id)
+                transcript = transcript_list.find_transcript(self._transcript_languages(preferred_language))
+                transcript_data = transcript.fetch()
+                transcript_text = "\n".join([item.text for item in transcript_data.snippets])
+                return transcript_text
+            except (NoTranscriptFound, TranscriptsDisabled) as e:
+                logging.error("Transcript not available for %s: %s", source, e)
+                raise TranscriptError(f"Transcript not available for {source}: {e}") from e
+            except Exception as e:
+                logging.error("An unexpected error occurred while fetching transcript for %s: %s", source, e)
+                raise TranscriptError(f"An unexpected error occurred while fetching transcript for {source}: {e}") from e
+
+    def get_transcript(self, video_url, preferred_language=None):
+        video_id = extract_video_id(video_url)
+        return self._fetch_transcript(video_id, video_url, preferred_language)
+
+    def get_transcripts(self, video_ids, preferred_language=None, max_workers=None):
+        """Fetch transcripts for many videos concurrently over the shared connection pool.
+
+        Each worker thread uses its own transcript client; all of them draw
+        connections from the same pool, which caps the number of workers.
+
+        Returns a dict mapping each video ID to its transcript text, or None if the
+        transcript could not be fetched.
+        """
+        video_ids = list(dict.fromkeys(video_ids))
+        if not video_ids:
+            return {}
+        # More workers than pooled connections would discard connections instead of reusing them
+        max_workers = min(max_workers or self.pool_size, self.pool_size, len(video_ids))
+        transcripts = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch_transcript, video_id, video_id, preferred_language): video_id
+                for video_id in video_ids
+            }
+            for future in as_completed(futures):
+                video_id = futures[future]
+                try:
+                    transcripts[video_id] = future.result()
+                except TranscriptError:
+                    transcripts[video_id] = None
+        return {video_id: transcripts[video_id] for video_id in video_ids}
 
 class GeminiService:
     def __init__(self, api_key):
@@ -76,21 +139,21 @@ class GeminiService:
             logging.info("Received response from Gemini API for video categorization.")
             return response.text.strip()
         except genai.types.BlockedPromptException as e:
-            logging.error(f"Gemini API video categorization failed due to blocked prompt: {e}")
+            logging.error("Gemini API video categorization failed due to blocked prompt: %s", e)
             raise GeminiServiceError(f"Gemini API video categorization failed due to blocked prompt: {e}") from e
         except genai.types.StopCandidateException as e:
-            logging.error(f"Gemini API video categorization failed due to stop candidate: {e}")
+            logging.error("Gemini API video categorization failed due to stop candidate: %s", e)
             raise GeminiServiceError(f"Gemini API video categorization failed due to stop candidate: {e}") from e
         except Exception as e:
-            logging.error(f"An unexpected error occurred during Gemini API video categorization: {e}")
+            logging.error("An unexpected error occurred during Gemini API video categorization: %s", e)
             raise GeminiServiceError(f"An unexpected error occurred during Gemini API video categorization: {e}") from e
 
-    def summarize_content(self, text, prompt):
+    def summarize_content(self, text, prompt, source_label="Transcript"):
         try:
-            logging.info(f"Sending request to Gemini API with prompt: {prompt[:50]}...")
-            response = self.model.generate_content(f"{prompt}\n\nTranscript:\n{text}")
+            logging.info("Sending request to Gemini API with prompt: %s...", prompt[:50])
+            response = self.model.generate_content(f"{prompt}\n\n{source_label}:\n{text}")
             logging.info("Received response from Gemini API.")
             return response.text
         except Exception as e:
-            logging.error(f"Gemini API summarization failed: {e}")
+            logging.error("Gemini API summarization failed: %s", e)
             raise GeminiServiceError(f"Gemini API summarization failed: {e}") from e
\ No newline at end of file
@@ -0,0 +1,124 @@
+import logging
+import os
+import shutil
+
+from .exceptions import OutputSinkError
+from .file_utils import sanitize_title, temp_path_for, fsync_path
+from .models import Video
+
+
+class OutputSink:
+    """Destination for the files generated for a single video.
+
+    Subclasses decide where a video's folder lives; committing writes every file
+    straight into that location without staging it anywhere else first. Sinks
+    that set ``keeps_transcript`` receive the transcript in the same commit as
+    the summaries; otherwise it is saved separately under ``outputs/``.
+    """
+
+    keeps_transcript = False
+
+    def __init__(self, fsync=False):
+        self.fsync = fsync
+
+    def destination(self, video_id, video: Video):
+        raise NotImplementedError
+
+    def exists(self, video_id, video: Video):
+        return os.path.exists(self.destination(video_id, video))
+
+    def commit(self, video_id, video: Video, files):
+        """Write ``files`` (a mapping of file name to content) for one video as a unit.
+
+        The files are written into a hidden sibling of the destination folder, which
+        is then renamed into place, so the folder only ever shows a complete set of
+        files. If the folder already exists, any files it holds that are not being
+        replaced are copied into the staging folder first, and the old folder is
+        kept as a hidden backup until the swap succeeds (and restored if it fails).
+        With ``fsync`` enabled the files are synced in one pass after all of them
+        have been written, followed by the affected directories.
+        """
+        destination = self.destination(video_id, video)
+        parent = os.path.dirname(destination)
+        staging_dir = temp_path_for(destination)
+        backup_dir = None
+        try:
+            os.makedirs(parent, exist_ok=True)
+            os.mkdir(staging_dir)
+            for name, content in files.items():
+                with open(os.path.join(staging_dir, name), "w") as f:
+                    f.write(content)
+            if os.path.exists(destination):
+                self._copy_unchanged(destination, staging_dir, files)
+            if self.fsync:
+                for name in os.listdir(staging_dir):
+                    fsync_path(os.path.join(staging_dir, name))
+                fsync_path(staging_dir)
+
+            if os.path.exists(destination):
+                backup_dir = temp_path_for(destination)
+                os.rename(destination, backup_dir)
+            os.rename(staging_dir, destination)
+
+            if self.fsync:
+                fsync_path(destination)
+                fsync_path(parent)
+        except BaseException as e:
+            if backup_dir and os.path.exists(backup_dir):
+                if os.path.exists(destination):
+                    # The swap went through and only syncing failed, so the backup is stale
+                    shutil.rmtree(backup_dir, ignore_errors=True)
+                else:
+                    os.rename(backup_dir, destination)
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            if not isinstance(e, (OSError, ValueError)):
+                raise
+            logging.error("Error writing output files to %s: %s", destination, e)
+            raise OutputSinkError(f"Error writing output files to {destination}: {e}") from e
+
+        if backup_dir:
+            shutil.rmtree(backup_dir, ignore_errors=True)
+        logging.info("Wrote %s to %s", ", ".join(files), destination)
+        return destination
+
+    @staticmethod
+    def _copy_unchanged(source_dir, staging_dir, files):
+        for name in os.listdir(source_dir):
+            if name in files:
+                continue
+            source = os.path.join(source_dir, name)
+            if os.path.isdir(source):
+                shutil.copytree(source, os.path.join(staging_dir, name))
+            else:
+                shutil.copy2(source, os.path.join(staging_dir, name))
+
+
+class LocalOutputSink(OutputSink):
+    """Writes each video's files, including its transcript, to ``<root>/<video_id>/``."""
+
+    keeps_transcript = True
+
+    def __init__(self, root="outputs", fsync=False):
+        super().__init__(fsync)
+        self.root = root
+
+    def destination(self, video_id, video: Video):
+        return os.path.join(self.root, video_id)
+
+
+class ObsidianVaultSink(OutputSink):
+    """Writes each video's files to ``<vault>/<date>/<sanitized title>/``."""
+
+    def __init__(self, vault_path, fsync=False):
+        super().__init__(fsync)
+        self.vault_path = vault_path
+
+    def destination(self, video_id, video: Video):
+        return os.path.expanduser(os.path.join(self.vault_path, video.date, sanitize_title(video.title)))
+
+
+def create_output_sink(obsidian_vault_path, fsync=False):
+    if not obsidian_vault_path:
+        logging.warning("OBSIDIAN_VAULT_PATH not set. Writing summaries to the local outputs directory.")
+        return LocalOutputSink(fsync=fsync)
+    return ObsidianVaultSink(obsidian_vault_path, fsync=fsync)
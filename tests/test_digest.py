@@ -0,0 +1,113 @@
+import pytest
+import os
+import hashlib
+from unittest.mock import MagicMock
+from casablanca.digest import DigestBuilder
+from datetime import date
+
+def add_video(vault, day, title, mtime):
+    folder = vault / day / title
+    folder.mkdir(parents=True)
+    (folder / "market_summary.md").write_text(f"Market view from {title}")
+    (folder / "expert_summary.md").write_text(f"Expert view from {title}")
+    os.utime(folder / "market_summary.md", (mtime, mtime))
+
+@pytest.fixture
+def mock_gemini_service():
+    service = MagicMock()
+    service.summarize_content.side_effect = lambda text, prompt, source_label: f"rollup of {hashlib.sha256(text.encode()).hexdigest()[:8]}"
+    return service
+
+@pytest.fixture
+def builder(tmp_path, mock_gemini_service):
+    return DigestBuilder(mock_gemini_service, str(tmp_path / "vault"), cache_dir=str(tmp_path / "cache"), prompt="Digest prompt", fan_in=2)
+
+def test_build_day_no_summaries(builder, mock_gemini_service):
+    assert builder.build_day("2023-01-02") is None
+    assert not mock_gemini_service.summarize_content.called
+
+def test_build_day_rolls_up_in_groups(tmp_path, builder, mock_gemini_service):
+    for i in range(3):
+        add_video(tmp_path / "vault", "2023-01-02", f"Video {i}", 1000 + i)
+
+    assert builder.build_day("2023-01-02").startswith("rollup of")
+    # Groups of 2 + 1 videos; the lone video is passed up as-is, then both are rolled up
+    assert mock_gemini_service.summarize_content.call_count == 2
+    first_text = mock_gemini_service.summarize_content.call_args_list[0].args[0]
+    assert "## Video 0" in first_text and "Expert view from Video 1" in first_text
+
+def test_build_day_uses_cache(tmp_path, builder, mock_gemini_service):
+    for i in range(3):
+        add_video(tmp_path / "vault", "2023-01-02", f"Video {i}", 1000 + i)
+    first = builder.build_day("2023-01-02")
+    mock_gemini_service.summarize_content.reset_mock()
+
+    assert builder.build_day("2023-01-02") == first
+    assert not mock_gemini_service.summarize_content.called
+
+def test_build_day_new_video_only_resummarizes_changed_branch(tmp_path, builder, mock_gemini_service):
+    for i in range(4):
+        add_video(tmp_path / "vault", "2023-01-02", f"Video {i}", 1000 + i)
+    builder.build_day("2023-01-02")
+    mock_gemini_service.summarize_content.reset_mock()
+
+    add_video(tmp_path / "vault", "2023-01-02", "Video 4", 2000)
+    builder.build_day("2023-01-02")
+
+    # Video 4 forms its own group and is passed up; the rollup of the two untouched
+    # groups comes from the cache, so only the day itself is summarized again
+    assert mock_gemini_service.summarize_content.call_count == 1
+    assert "Video 4" in mock_gemini_service.summarize_content.call_args.args[0]
+    assert "Video 0" not in mock_gemini_service.summarize_content.call_args.args[0]
+
+def test_build_day_reprocessed_video_keeps_its_position(tmp_path, builder, mock_gemini_service):
+    vault = tmp_path / "vault"
+    for i in range(5):
+        add_video(vault, "2023-01-02", f"Video {i}", 1000 + i)
+    builder.build_day("2023-01-02")
+    mock_gemini_service.summarize_content.reset_mock()
+
+    # A --force re-run rewrites the summaries and makes them the newest in the day
+    (vault / "2023-01-02" / "Video 0" / "market_summary.md").write_text("Revised market view")
+    os.utime(vault / "2023-01-02" / "Video 0" / "market_summary.md", (5000, 5000))
+    builder.build_day("2023-01-02")
+
+    # Only the group of Video 0 and 1, the level above it and the day are redone
+    calls = mock_gemini_service.summarize_content.call_args_list
+    assert len(calls) == 3
+    assert "Revised market view" in calls[0].args[0] and "## Video 1" in calls[0].args[0]
+
+def test_build_day_single_video_is_not_summarized(tmp_path, builder, mock_gemini_service):
+    add_video(tmp_path / "vault", "2023-01-02", "Video 0", 1000)
+    assert "Market view from Video 0" in builder.build_day("2023-01-02")
+    assert not mock_gemini_service.summarize_content.called
+
+def test_write_range_with_weekly(tmp_path, builder, mock_gemini_service):
+    vault = tmp_path / "vault"
+    add_video(vault, "2023-01-02", "Monday Video", 1000)
+    add_video(vault, "2023-01-04", "Wednesday Video", 1000)
+
+    paths = builder.write_range(date(2023, 1, 2), date(2023, 1, 3), weekly=True)
+
+    assert paths == [
+        os.path.join(str(vault), "2023-01-02", "Market View.md"),
+        os.path.join(str(vault), "Digests", "2023-W01.md"),
+    ]
+    assert (vault / "2023-01-02" / "Market View.md").read_text().startswith("# Market View 2023-01-02")
+    assert not (vault / "2023-01-03").exists()
+    # The weekly digest covers the whole ISO week, including days outside the range
+    week_text = mock_gemini_service.summarize_content.call_args.args[0]
+    assert "## 2023-01-02" in week_text and "## 2023-01-04" in week_text
+
+def test_daily_note_is_not_treated_as_a_video(tmp_path, builder, mock_gemini_service):
+    add_video(tmp_path / "vault", "2023-01-02", "Video 0", 1000)
+    add_video(tmp_path / "vault", "2023-01-02", "Video 1", 1001)
+    builder.write_day("2023-01-02")
+    mock_gemini_service.summarize_content.reset_mock()
+
+    builder.write_day("2023-01-02")
+    assert not mock_gemini_service.summarize_content.called
+
+def test_fan_in_must_be_at_least_two(mock_gemini_service):
+    with pytest.raises(ValueError, match="fan_in must be at least 2."):
+        DigestBuilder(mock_gemini_service, "/vault", fan_in=1)
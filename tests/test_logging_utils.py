@@ -0,0 +1,69 @@
+import pytest
+import json
+import logging
+from casablanca.logging_utils import JsonFormatter, VideoContextFilter, configure_logging, start_queue_listener, video_context
+
+def make_record(msg, *args):
+    return logging.LogRecord("casablanca", logging.INFO, __file__, 1, msg, args, None)
+
+def test_video_context_filter_tags_record():
+    record = make_record("Processing %s", "video")
+    with video_context("test_id"):
+        VideoContextFilter().filter(record)
+    assert record.video_id == "test_id"
+
+def test_video_context_filter_outside_context():
+    record = make_record("Processing")
+    VideoContextFilter().filter(record)
+    assert record.video_id is None
+
+def test_json_formatter_output():
+    record = make_record("Video Category: %s", "Finance")
+    with video_context("test_id"):
+        VideoContextFilter().filter(record)
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "Video Category: Finance"
+    assert entry["level"] == "INFO"
+    assert entry["video_id"] == "test_id"
+
+def test_queue_listener_writes_from_background_thread():
+    records = []
+
+    class CollectingHandler(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    queue_handler, listener = start_queue_listener([CollectingHandler()])
+    queue_handler.addFilter(VideoContextFilter())
+    with video_context("test_id"):
+        queue_handler.handle(make_record("Transcript saved to %s", "path"))
+    listener.stop()
+
+    assert len(records) == 1
+    assert records[0].getMessage() == "Transcript saved to path"
+    assert records[0].video_id == "test_id"
+
+@pytest.fixture
+def restore_root_logger():
+    handlers, level = list(logging.root.handlers), logging.root.level
+    yield
+    for handler in logging.root.handlers:
+        if handler not in handlers:
+            logging.root.removeHandler(handler)
+            handler.close()
+    logging.root.setLevel(level)
+
+def test_configure_logging_queue_json(tmp_path, monkeypatch, restore_root_logger):
+    monkeypatch.chdir(tmp_path)
+    listener = configure_logging("INFO", queue_logging=True, json_format=True)
+    try:
+        raise ValueError("Boom")
+    except ValueError:
+        with video_context("test_id"):
+            logging.critical("An unexpected error occurred: %s", "Boom", exc_info=True)
+    listener.stop()
+
+    entry = json.loads((tmp_path / "casablanca.log").read_text().splitlines()[-1])
+    assert entry["message"] == "An unexpected error occurred: Boom"
+    assert entry["video_id"] == "test_id"
+    assert "ValueError: Boom" in entry["exc_info"]
@@ -44,4 +44,23 @@ def test_cli_non_finance_video(mock_gemini_service, mock_youtube_service, mock_g
     assert "Video is not finance-related (Education). Skipping transcript fetching and summarization." in logs
     mock_classify_video.assert_called_once()
     mock_youtube_service.return_value.get_transcript.assert_not_called()
-    mock_gemini_service.return_value.summarize_content.assert_not_called()
\ No newline at end of file
+    mock_gemini_service.return_value.summarize_content.assert_not_called()
+
+@patch('casablanca.main.configure_logging')
+@patch('casablanca.main.VideoProcessor')
+@patch('casablanca.main.YouTubeService')
+@patch('casablanca.main.GeminiService')
+def test_cli_logging_options(mock_gemini_service, mock_youtube_service, mock_processor, mock_configure_logging):
+    result = CliRunner().invoke(cli, ["https://www.youtube.com/watch?v=test_id", "--log-queue", "--log-json"])
+
+    assert result.exit_code == 0
+    mock_configure_logging.assert_called_once_with("INFO", queue_logging=True, json_format=True)
+    mock_configure_logging.return_value.stop.assert_called_once()
+
+@patch('casablanca.main.configure_logging')
+@patch('casablanca.main.YouTubeService', side_effect=Exception("Setup failed"))
+def test_cli_stops_listener_when_setup_fails(mock_youtube_service, mock_configure_logging):
+    result = CliRunner().invoke(cli, ["https://www.youtube.com/watch?v=test_id", "--log-queue"])
+
+    assert result.exit_code == 1
+    mock_configure_logging.return_value.stop.assert_called_once()
@@ -50,25 +50,45 @@ def test_classify_video(processor, mock_gemini_service):
     category = processor._classify_video("title", "description", "Finance,News")
     assert category == "Finance"
 
-@patch('builtins.open')
-@patch('casablanca.processor.move_to_obsidian')
-def test_process_finance_video(mock_move, mock_open, processor, mock_youtube_service, mock_gemini_service, mock_video):
+@patch('casablanca.processor.generate_transcript_path', return_value="transcript_path")
+@patch('casablanca.processor.atomic_write')
+def test_process_finance_video(mock_atomic_write, mock_transcript_path, processor, mock_youtube_service, mock_gemini_service, mock_video):
     mock_youtube_service.get_transcript.return_value = "transcript"
-    mock_gemini_service.summarize_content.return_value = "summary"
-    processor._process_finance_video("url", "dir", "exp_path", "mkt_path", "exp_prompt", "mkt_prompt", mock_video)
+    mock_gemini_service.summarize_content.side_effect = ["expert summary", "market summary"]
+    processor.sink = MagicMock(keeps_transcript=False)
+    processor._process_finance_video("video_id", "url", "exp_prompt", "mkt_prompt", mock_video)
     assert mock_youtube_service.get_transcript.called
     assert mock_gemini_service.summarize_content.call_count == 2
-    assert mock_move.called
+    mock_transcript_path.assert_called_once_with("video_id")
+    mock_atomic_write.assert_called_once_with("transcript_path", "transcript")
+    processor.sink.commit.assert_called_once_with("video_id", mock_video, {
+        "expert_summary.md": "expert summary",
+        "market_summary.md": "market summary",
+    })
+
+@patch('casablanca.processor.generate_transcript_path')
+@patch('casablanca.processor.atomic_write')
+def test_process_finance_video_transcript_committed_with_summaries(mock_atomic_write, mock_transcript_path, processor, mock_youtube_service, mock_gemini_service, mock_video):
+    mock_youtube_service.get_transcript.return_value = "transcript"
+    mock_gemini_service.summarize_content.side_effect = ["expert summary", "market summary"]
+    processor.sink = MagicMock(keeps_transcript=True)
+    processor._process_finance_video("video_id", "url", "exp_prompt", "mkt_prompt", mock_video)
+    assert not mock_transcript_path.called
+    assert not mock_atomic_write.called
+    processor.sink.commit.assert_called_once_with("video_id", mock_video, {
+        "expert_summary.md": "expert summary",
+        "market_summary.md": "market summary",
+        "transcript.txt": "transcript",
+    })
 
 def test_process_finance_video_no_transcript(processor, mock_youtube_service):
     mock_youtube_service.get_transcript.return_value = None
+    processor.sink = MagicMock()
     with pytest.raises(TranscriptError):
-        processor._process_finance_video("url", "dir", "exp_path", "mkt_path", "exp_prompt", "mkt_prompt", MagicMock())        
+        processor._process_finance_video("video_id", "url", "exp_prompt", "mkt_prompt", MagicMock())
+    assert not processor.sink.commit.called
 
-@patch('casablanca.processor.generate_output_paths')
-@patch('os.makedirs')
-def test_process_news_video(mock_mkdirs, mock_paths, processor, mock_youtube_service, mock_gemini_service, mock_video):
-    mock_paths.return_value = ("dir", "exp_path", "mkt_path")
+def test_process_news_video(processor, mock_youtube_service, mock_gemini_service, mock_video):
     processor._get_video_info = MagicMock(return_value=mock_video)
     processor._check_existing_output = MagicMock(return_value=False)
     processor._classify_video = MagicMock(return_value="News")
@@ -78,10 +98,7 @@ def test_process_news_video(mock_mkdirs, mock_paths, processor, mock_youtube_ser
 
     assert processor._process_finance_video.called
 
-@patch('casablanca.processor.generate_output_paths')
-@patch('os.makedirs')
-def test_process_existing_output(mock_mkdirs, mock_paths, processor, mock_video):
-    mock_paths.return_value = ("dir", "exp_path", "mkt_path")
+def test_process_existing_output(processor, mock_video):
     processor._get_video_info = MagicMock(return_value=mock_video)
     processor._check_existing_output = MagicMock(return_value=True)
     processor._classify_video = MagicMock()
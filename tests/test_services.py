@@ -7,6 +7,8 @@ from youtube_transcript_api import NoTranscriptFound, TranscriptsDisabled
 import google.generativeai as genai
 from googleapiclient.discovery import build
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import threading
 from googleapiclient.errors import HttpError
 
 # Mock API keys for testing
@@ -133,6 +135,78 @@ def test_youtube_service_get_transcript_invalid_url(mock_youtube_transcript_api,
     with pytest.raises(TranscriptError, match="An unexpected error occurred while fetching transcript"):
         service.get_transcript(video_url)
 
+@patch('casablanca.services.YouTubeTranscriptApi')
+def test_youtube_service_get_transcript_preferred_language(mock_youtube_transcript_api, youtube_service):
+    service, _, _ = youtube_service
+    mock_transcript_list = mock_youtube_transcript_api.return_value.list.return_value
+    mock_transcript_list.find_transcript.return_value.fetch.return_value.snippets = []
+    service.get_transcript("https://www.youtube.com/watch?v=test_video_id", preferred_language="de")
+    mock_transcript_list.find_transcript.assert_called_once_with(['de', 'en'])
+
+@patch('casablanca.services.YouTubeTranscriptApi')
+def test_youtube_service_reuses_pooled_transcript_client(mock_youtube_transcript_api, youtube_service):
+    service, _, _ = youtube_service
+    mock_youtube_transcript_api.return_value.list.return_value.find_transcript.return_value.fetch.return_value.snippets = []
+    service.get_transcript("https://www.youtube.com/watch?v=first_id")
+    service.get_transcript("https://www.youtube.com/watch?v=second_id")
+    mock_youtube_transcript_api.assert_called_once()
+    session = mock_youtube_transcript_api.call_args.kwargs["http_client"]
+    assert session.get_adapter("https://www.youtube.com") is service._transcript_adapter
+    assert service._transcript_adapter._pool_maxsize == service.pool_size
+
+@patch('casablanca.services.YouTubeTranscriptApi')
+def test_youtube_service_transcript_client_per_thread(mock_youtube_transcript_api, youtube_service):
+    service, _, _ = youtube_service
+    mock_youtube_transcript_api.side_effect = lambda http_client: MagicMock(http_client=http_client)
+    barrier = threading.Barrier(2)
+
+    def get_client():
+        # Keep both threads alive at once so the executor cannot reuse one for both calls
+        client = service._get_transcript_api()
+        barrier.wait()
+        return client
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first, second = [future.result() for future in [executor.submit(get_client), executor.submit(get_client)]]
+
+    assert first is not second
+    assert first.http_client is not second.http_client
+    assert first.http_client.get_adapter("https://www.youtube.com") is service._transcript_adapter
+    assert second.http_client.get_adapter("https://www.youtube.com") is service._transcript_adapter
+
+@patch('casablanca.services.YouTubeTranscriptApi')
+def test_youtube_service_get_transcripts(mock_youtube_transcript_api, youtube_service):
+    service, _, _ = youtube_service
+
+    class MockSnippet:
+        def __init__(self, text):
+            self.text = text
+
+    def list_transcripts(video_id):
+        if video_id == "missing_id":
+            raise TranscriptsDisabled(video_id)
+        transcript_list = MagicMock()
+        transcript_list.find_transcript.return_value.fetch.return_value.snippets = [MockSnippet(video_id)]
+        return transcript_list
+
+    mock_youtube_transcript_api.return_value.list.side_effect = list_transcripts
+    transcripts = service.get_transcripts(["id_one", "missing_id", "id_two", "id_one"])
+    assert transcripts == {"id_one": "id_one", "missing_id": None, "id_two": "id_two"}
+    assert list(transcripts) == ["id_one", "missing_id", "id_two"]
+
+@patch('casablanca.services.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+@patch('casablanca.services.YouTubeTranscriptApi')
+def test_youtube_service_get_transcripts_caps_workers_at_pool_size(mock_youtube_transcript_api, mock_executor, youtube_service):
+    service, _, _ = youtube_service
+    mock_youtube_transcript_api.return_value.list.return_value.find_transcript.return_value.fetch.return_value.snippets = []
+    video_ids = [f"id_{i}" for i in range(service.pool_size + 5)]
+    service.get_transcripts(video_ids, max_workers=service.pool_size * 2)
+    mock_executor.assert_called_once_with(max_workers=service.pool_size)
+
+def test_youtube_service_get_transcripts_empty(youtube_service):
+    service, _, _ = youtube_service
+    assert service.get_transcripts([]) == {}
+
 # GeminiService Tests
 
 def test_gemini_service_get_video_category_success(gemini_service):
@@ -0,0 +1,118 @@
+import pytest
+import os
+from unittest.mock import patch
+from casablanca.sinks import LocalOutputSink, ObsidianVaultSink, create_output_sink
+from casablanca.exceptions import OutputSinkError
+from casablanca.models import Video
+from datetime import datetime
+
+FILES = {"expert_summary.md": "Expert content", "market_summary.md": "Market content"}
+
+@pytest.fixture
+def video():
+    return Video(title="Test Video: Part 1", description="Test Description", published_at=datetime(2023, 1, 1))
+
+def test_obsidian_vault_sink_destination(video):
+    sink = ObsidianVaultSink("/mock/obsidian/vault")
+    assert sink.destination("video_id", video) == os.path.join("/mock/obsidian/vault", "2023-01-01", "Test Video Part 1")
+
+def test_local_output_sink_destination(video):
+    sink = LocalOutputSink()
+    assert sink.destination("video_id", video) == os.path.join("outputs", "video_id")
+
+def test_commit_creates_folder(tmp_path, video):
+    sink = ObsidianVaultSink(str(tmp_path), fsync=True)
+    destination = sink.commit("video_id", video, FILES)
+
+    assert destination == os.path.join(str(tmp_path), "2023-01-01", "Test Video Part 1")
+    assert sorted(os.listdir(destination)) == ["expert_summary.md", "market_summary.md"]
+    assert (tmp_path / "2023-01-01" / "Test Video Part 1" / "market_summary.md").read_text() == "Market content"
+    assert os.listdir(tmp_path / "2023-01-01") == ["Test Video Part 1"]
+
+def test_commit_replaces_files_in_existing_folder(tmp_path, video):
+    destination = tmp_path / "video_id"
+    destination.mkdir()
+    (destination / "transcript.txt").write_text("Transcript")
+    (destination / "expert_summary.md").write_text("Old expert content")
+
+    LocalOutputSink(str(tmp_path)).commit("video_id", video, FILES)
+
+    assert sorted(os.listdir(destination)) == ["expert_summary.md", "market_summary.md", "transcript.txt"]
+    assert (destination / "expert_summary.md").read_text() == "Expert content"
+    assert os.listdir(tmp_path) == ["video_id"]
+
+def test_commit_failure_leaves_no_partial_folder(tmp_path, video):
+    sink = ObsidianVaultSink(str(tmp_path))
+    with patch('os.rename', side_effect=OSError("Permission denied")):
+        with pytest.raises(OutputSinkError, match="Error writing output files"):
+            sink.commit("video_id", video, FILES)
+    assert os.listdir(tmp_path / "2023-01-01") == []
+    assert not sink.exists("video_id", video)
+
+def test_commit_failure_restores_existing_folder(tmp_path, video):
+    destination = tmp_path / "video_id"
+    destination.mkdir()
+    (destination / "transcript.txt").write_text("Transcript")
+    (destination / "expert_summary.md").write_text("Old expert content")
+    (destination / "market_summary.md").write_text("Old market content")
+
+    real_rename = os.rename
+    calls = []
+
+    def rename(src, dst):
+        calls.append((src, dst))
+        # Fail moving the staging folder into place, after the old folder was moved aside
+        if len(calls) == 2:
+            raise OSError("Disk full")
+        real_rename(src, dst)
+
+    with patch('os.rename', side_effect=rename):
+        with pytest.raises(OutputSinkError, match="Disk full"):
+            LocalOutputSink(str(tmp_path)).commit("video_id", video, FILES)
+
+    assert len(calls) == 3
+    assert os.listdir(tmp_path) == ["video_id"]
+    assert sorted(os.listdir(destination)) == ["expert_summary.md", "market_summary.md", "transcript.txt"]
+    assert (destination / "expert_summary.md").read_text() == "Old expert content"
+    assert (destination / "market_summary.md").read_text() == "Old market content"
+
+def test_commit_non_os_error_is_wrapped_and_cleaned_up(tmp_path, video):
+    sink = ObsidianVaultSink(str(tmp_path))
+    error = UnicodeEncodeError("ascii", "caf\u00e9", 3, 4, "ordinal not in range(128)")
+    with patch('builtins.open', side_effect=error):
+        with pytest.raises(OutputSinkError, match="ordinal not in range"):
+            sink.commit("video_id", video, FILES)
+    assert os.listdir(tmp_path / "2023-01-01") == []
+
+def test_commit_interrupted_restores_existing_folder(tmp_path, video):
+    destination = tmp_path / "video_id"
+    destination.mkdir()
+    (destination / "expert_summary.md").write_text("Old expert content")
+
+    real_rename = os.rename
+    calls = []
+
+    def rename(src, dst):
+        calls.append((src, dst))
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        real_rename(src, dst)
+
+    with patch('os.rename', side_effect=rename):
+        with pytest.raises(KeyboardInterrupt):
+            LocalOutputSink(str(tmp_path)).commit("video_id", video, FILES)
+
+    assert os.listdir(tmp_path) == ["video_id"]
+    assert os.listdir(destination) == ["expert_summary.md"]
+    assert (destination / "expert_summary.md").read_text() == "Old expert content"
+
+@patch('logging.warning')
+def test_create_output_sink_without_vault(mock_log_warning):
+    sink = create_output_sink(None)
+    assert isinstance(sink, LocalOutputSink)
+    mock_log_warning.assert_called_once_with("OBSIDIAN_VAULT_PATH not set. Writing summaries to the local outputs directory.")
+
+def test_create_output_sink_with_vault():
+    sink = create_output_sink("/mock/obsidian/vault", fsync=True)
+    assert isinstance(sink, ObsidianVaultSink)
+    assert sink.fsync
@@ -0,0 +1,8 @@
+# Names vulture cannot see being used: stdlib hook overrides and the public
+# bulk transcript API. Run with `vulture` (paths are set in pyproject.toml).
+from casablanca.logging_utils import DeferredFormatQueueHandler, JsonFormatter
+from casablanca.services import YouTubeService
+
+JsonFormatter.format  # called by logging.Handler.format
+DeferredFormatQueueHandler.prepare  # called by logging.handlers.QueueHandler.emit
+YouTubeService.get_transcripts  # public bulk-fetch API